@@ -1,10 +1,168 @@
 # -*- coding: utf-8 -*-
-from enum import Enum
 import copy
+from enum import IntEnum
+from array import array
+from bisect import bisect_right
+from functools import wraps
+from operator import attrgetter, itemgetter
+try:
+    from collections.abc import MutableSequence
+except ImportError:
+    # Python 2
+    from collections import MutableSequence
 from math import pi, atan, tan, radians, degrees, log
 
+# Standard gravity [m/s²], relates specific impulse to exhaust velocity
+G0 = 9.80665
+INV_G0 = 1.0 / G0
+
+# Pulls length off of a stage or component, for summing in C
+_get_length = attrgetter('length')
+
+# log(2), for taking base 2 logarithms
+_LOG2 = log(2)
+
+# Bumped every time something that feeds a cached value in a document changes.
+# Cached aggregates (like mass) remember the generation they were computed at
+# and are only reused while it is still current.
+#
+# This is deliberately one counter for the whole process, not one per rocket.
+# Components don't know their parents, and the same component (or stage) can
+# be put into more than one tree, so a per-tree counter would need back
+# references that every list edit keeps up to date. The price of a single
+# counter is that a change to one document makes every other document
+# recompute its aggregates the next time they are asked for. They are never
+# stale, and recomputing is the same work the uncached properties used to do
+# on every read.
+_generation = 0
+
+
+def _touch():
+    """Invalidate every cached aggregate in every document"""
+    global _generation
+    _generation += 1
+
+
+def _memoized(getter):
+    """Decorator for property getters (and other methods that take no
+    arguments) that derive a value from the rest of the document. The value is
+    computed once and reused until the document changes. The class needs
+    ``_cache`` and ``_cache_generation`` slots to hold it.
+    """
+    name = getter.__name__
+
+    @wraps(getter)
+    def cached_getter(self):
+        if self._cache_generation != _generation:
+            self._cache = {}
+            self._cache_generation = _generation
+        if name not in self._cache:
+            self._cache[name] = getter(self)
+        return self._cache[name]
+    return cached_getter
+
+
+def _total_mass(components):
+    """Dry mass of a list of components and everything inside them. Walks the
+    tree with an explicit stack instead of recursing through each component.
+    """
+    total = 0
+    stack = list(components)
+    while stack:
+        c = stack.pop()
+        total += c._mass
+        stack.extend(c.components)
+    return total
+
+
+def _nar_index(I_total):
+    """How many times we double 2.5 N·s to reach the NAR impulse class of a
+    motor with this total impulse.
+    """
+    return int(log(I_total/2.5)/_LOG2)
+
+
+def _trapz(y, x):
+    """Integrate y(x) with the trapezoidal rule.
+
+    :param list y: sample values
+    :param list x: sample points, same length as y
+    """
+    dx = (x1 - x0 for x0, x1 in zip(x, x[1:]))
+    fsum = (f0 + f1 for f0, f1 in zip(y, y[1:]))
+    return sum(d * f for d, f in zip(dx, fsum)) * 0.5
+
+
+def _integrate_curve(t, thrust):
+    """Reduce a sampled thrustcurve to its bulk numbers.
+
+    :param list t: **[s]** sample times
+    :param list thrust: **[N]** thrust at each sample time
+    :returns: (total impulse, peak thrust, burn time)
+    """
+    return _trapz(thrust, t), max(thrust), t[-1]
+
+
+class _ObservedList(list):
+    """A list that invalidates cached aggregates whenever it is modified.
+    Used for the lists of stages and components so that a change anywhere in
+    the tree is seen by the cached mass of the whole rocket.
+    """
+
+    def __setitem__(self, key, value):
+        super(_ObservedList, self).__setitem__(key, value)
+        _touch()
+
+    def __delitem__(self, key):
+        super(_ObservedList, self).__delitem__(key)
+        _touch()
 
-class Noseshape(Enum):
+    def __setslice__(self, i, j, sequence):
+        # Python 2 only
+        super(_ObservedList, self).__setslice__(i, j, sequence)
+        _touch()
+
+    def __delslice__(self, i, j):
+        # Python 2 only
+        super(_ObservedList, self).__delslice__(i, j)
+        _touch()
+
+    def __iadd__(self, other):
+        result = super(_ObservedList, self).__iadd__(other)
+        _touch()
+        return result
+
+    def __imul__(self, n):
+        result = super(_ObservedList, self).__imul__(n)
+        _touch()
+        return result
+
+    def append(self, item):
+        super(_ObservedList, self).append(item)
+        _touch()
+
+    def extend(self, items):
+        super(_ObservedList, self).extend(items)
+        _touch()
+
+    def insert(self, index, item):
+        super(_ObservedList, self).insert(index, item)
+        _touch()
+
+    def pop(self, *args):
+        item = super(_ObservedList, self).pop(*args)
+        _touch()
+        return item
+
+    def remove(self, item):
+        super(_ObservedList, self).remove(item)
+        _touch()
+
+    def clear(self):
+        del self[:]
+
+
+class Noseshape(IntEnum):
     """Enum defining possible shapes of a nosecone.
     """
 
@@ -72,12 +230,15 @@ class Rocket(object):
     **Members:**
     """
 
+    __slots__ = ('name', '_stages', '_cache', '_cache_generation', 'aero_properties', 'description', 'manufacturer')
+
     def __init__(self, name):
         self.name = name
         """Name of this rocket"""
 
+        self._cache = {}
+        self._cache_generation = None
         self.stages = []
-        """List of stages that makes up the rocket."""
 
         self.aero_properties = {}
         """Dictionary of aerodynamic properties, like drag and lift coefficients"""
@@ -89,9 +250,22 @@ class Rocket(object):
         """If applicable, a manufacturer or prime contractor"""
 
     @property
+    def stages(self):
+        """List of stages that makes up the rocket. Setting this takes a copy
+        of the list given, so make later changes through ``rocket.stages``.
+        """
+        return self._stages
+
+    @stages.setter
+    def stages(self, stages):
+        self._stages = _ObservedList(stages)
+        _touch()
+
+    @property
+    @_memoized
     def mass(self):
         """**[kg]** Get the total *dry* mass of the rocket"""
-        return sum(stage.mass for stage in self.stages)
+        return _total_mass([c for stage in self.stages for c in stage.components])
 
     @property
     def name_slug(self):
@@ -118,7 +292,7 @@ class Rocket(object):
     @property
     def length(self):
         """**[m]** Get the total length of the rocket"""
-        return sum(stage.length for stage in self.stages)
+        return sum(map(_get_length, self.stages))
 
     @property
     def diameter(self):
@@ -138,22 +312,39 @@ class Stage(object):
     **Members:**
     """
 
+    __slots__ = ('name', '_components', '_cache', '_cache_generation')
+
     def __init__(self, name):
         self.name = name
         """Name of the stage."""
 
+        self._cache = {}
+        self._cache_generation = None
         self.components = []
-        """A list of components that make up the stage."""
 
     @property
+    def components(self):
+        """A list of components that make up the stage. Setting this takes a
+        copy of the list given, so make later changes through
+        ``stage.components``.
+        """
+        return self._components
+
+    @components.setter
+    def components(self, components):
+        self._components = _ObservedList(components)
+        _touch()
+
+    @property
+    @_memoized
     def mass(self):
         """**[kg]** Get the total *dry* mass of this stage"""
-        return sum(c.mass for c in self.components)
+        return _total_mass(self.components)
 
     @property
     def length(self):
         """**[m]** Get the total length of this stage"""
-        return sum(c.length for c in self.components)
+        return sum(map(_get_length, self.components))
 
     @property
     def diameter(self):
@@ -191,6 +382,9 @@ class Component(object):
     """A Component is a piece of the rocket like a fin or nosecone.
     """
 
+    __slots__ = ('name', 'length', 'diameter', '_mass', '_cache', '_cache_generation', '_color', '_material_name', '_components',
+                 '_tags', '_class_tags')
+
     def __init__(self, name, mass=0.0, length=0.0, diameter=0.0, material_name=""):
         self.name = name
         """Name"""
@@ -202,14 +396,13 @@ class Component(object):
         """**[m]** Diameter"""
 
         self._mass = mass
+        self._cache = {}
+        self._cache_generation = None
         self._color = None
         self._material_name = material_name
 
         self.components = []
-        """List of components inside this component."""
-
         self.tags = []
-        """A list of tags that may describe this component."""
 
     def add_class_tag(self, newclass, newtag):
         """Add a new tag that is part of a tag collection (class)
@@ -219,24 +412,64 @@ class Component(object):
 
         """
 
-        for tag in self.tags:
-            if type(tag) is dict:
-                if tag['class'] == newclass:
-                    tag['tags'].append(newtag)
-                    return
+        # Remember where each class lives so we don't search the tags every
+        # time. The tags list can be edited directly, so only trust that
+        # while the same dict is still at the same place for the same class.
+        tags = self.tags
+        entry = self._class_tags.get(newclass)
+        if entry is not None:
+            i, tag = entry
+            if i >= len(tags) or tags[i] is not tag or tag.get('class') != newclass:
+                entry = None
+
+        if entry is None:
+            for i, tag in enumerate(tags):
+                if type(tag) is dict:
+                    if tag['class'] == newclass:
+                        break
+            else:
+                i = len(tags)
+                tag = {'class': newclass, 'tags': []}
+                tags.append(tag)
+            self._class_tags[newclass] = (i, tag)
+
+        tag['tags'].append(newtag)
+
+    @property
+    def tags(self):
+        """A list of tags that may describe this component."""
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags):
+        self._tags = tags
+        self._class_tags = {}
+
+    @property
+    def components(self):
+        """List of components inside this component. Setting this takes a
+        copy of the list given, so make later changes through
+        ``component.components``.
+        """
+        return self._components
 
-        self.tags.append({'class': newclass, 'tags': [newtag]})
+    @components.setter
+    def components(self, components):
+        self._components = _ObservedList(components)
+        _touch()
 
     @property
+    @_memoized
     def mass(self):
         """**[kg]** The total *dry mass* of this component, **including all
         subcomponents**.
         """
-        return self._mass + sum([c.mass for c in self.components])
+        return self._mass + _total_mass(self.components)
 
     @mass.setter
     def mass(self, m):
         self._mass = float(m)
+        _touch()
 
     @property
     def component_mass(self):
@@ -318,6 +551,8 @@ class Mass(Component):
 
     """
 
+    __slots__ = ('center',)
+
     def __init__(self, name, mass, **kwargs):
         super(Mass, self).__init__(name, mass=mass, **kwargs)
 
@@ -360,11 +595,14 @@ class Nosecone(Component):
     **Members:**
     """
 
+    __slots__ = ('shape', 'shape_parameter', 'thickness', 'density', '_roughness')
+
     def __init__(self, shape, shape_parameter, mass, length, **kwargs):
         super(Nosecone, self).__init__("Nosecone", length=length, mass=mass, **kwargs)
         self.shape = shape
         self.shape_parameter = shape_parameter
         self.thickness = 0
+        self.density = 0
         self._roughness = 0
 
     def __repr__(self):
@@ -409,6 +647,8 @@ class Bodytube(Component):
     **Members:**
     """
 
+    __slots__ = ('thickness', '_roughness', '_density')
+
     def __init__(self, name, mass, length, **kwargs):
         super(Bodytube, self).__init__(name, mass=mass, length=length, **kwargs)
         self._roughness = 0
@@ -441,9 +681,10 @@ class Bodytube(Component):
         if self._density is not None and self._mass == 0:
             return self._density
         if self.thickness > 0:
-            r1 = self.diameter / 2.0
+            # mass over the volume of the tube wall
+            r1 = self.diameter * 0.5
             r2 = r1 - self.thickness
-            return self.component_mass / (pi * self.length * (r1**2 + r2**2))
+            return self.component_mass / (pi * self.length * (r1*r1 - r2*r2))
         return 0
 
     @density.setter
@@ -487,6 +728,8 @@ class Fin(Component):
     **Members:**
     """
 
+    __slots__ = ('root', 'tip', 'span', 'thickness', '_sweep', '_sweepangle', '_tan_sweepangle')
+
     def __init__(self, name, root, tip, span, sweep=None, sweepangle=45.0, **kwargs):
         super(Fin, self).__init__(name, length=root, **kwargs)
 
@@ -499,12 +742,48 @@ class Fin(Component):
         self.span = span
         """**[m]** Height of the fin away from the rocket body"""
 
+        self.thickness = 0
+        """**[m]** Thickness of the fin"""
+
         self._sweep = sweep
         self._sweepangle = sweepangle
+        self._tan_sweepangle = tan(radians(sweepangle)) if sweepangle is not None else None
 
     def __repr__(self):
         return "<openrocketdoc.document.Fin \"%s\">" % (self.name)
 
+    def _clone(self):
+        """A copy of this fin that shares nothing mutable with it. Much
+        cheaper than a deepcopy, since we know exactly what a fin is made of.
+        """
+        cls = type(self)
+        if cls is not Fin:
+            # a subclass may hold more than we know how to copy
+            return copy.deepcopy(self)
+
+        c = cls.__new__(cls)
+        c.name = self.name
+        c.length = self.length
+        c.diameter = self.diameter
+        c._mass = self._mass
+        c._cache = {}
+        c._cache_generation = None
+        c._color = self._color
+        c._material_name = self._material_name
+        if self.components:
+            c.components = copy.deepcopy(self.components)
+        else:
+            c.components = []
+        c.tags = [dict(tag, tags=list(tag['tags'])) if type(tag) is dict else tag for tag in self.tags]
+        c.root = self.root
+        c.tip = self.tip
+        c.span = self.span
+        c.thickness = self.thickness
+        c._sweep = self._sweep
+        c._sweepangle = self._sweepangle
+        c._tan_sweepangle = self._tan_sweepangle
+        return c
+
     @property
     def sweep(self):
         """**[m]** The Distance from the start of the fin to the beginning of
@@ -512,7 +791,7 @@ class Fin(Component):
         """
         if self._sweep is not None:
             return self._sweep
-        return self.span * tan(radians(self._sweepangle))
+        return self.span * self._tan_sweepangle
 
     @sweep.setter
     def sweep(self, s):
@@ -531,6 +810,7 @@ class Fin(Component):
     def sweepangle(self, s):
         self._sweep = None
         self._sweepangle = s
+        self._tan_sweepangle = tan(radians(s))
 
 
 class Finset(Component):
@@ -555,6 +835,8 @@ class Finset(Component):
     **Members:**
     """
 
+    __slots__ = ('_fin',)
+
     def __init__(self, name, fin, number_of_fins, **kwargs):
         super(Finset, self).__init__(name, **kwargs)
 
@@ -572,13 +854,15 @@ class Finset(Component):
 
     @number_of_fins.setter
     def number_of_fins(self, n):
-        self.components = []
+        # Build a copy of the fin object for every fin in the set
+        self.components = [self._make_fin(self._fin, i) for i in range(n)]
 
-        # Build a copy of the fin object
-        for i in range(n):
-            fin_copy = copy.deepcopy(self._fin)
-            fin_copy.name = "Fin %d" % (i + 1)
-            self.components.append(fin_copy)
+    @staticmethod
+    def _make_fin(fin, i):
+        """Copy of the prototype fin, named for its place in the set"""
+        fin_copy = fin._clone()
+        fin_copy.name = "Fin %d" % (i + 1)
+        return fin_copy
 
     @property
     def fin(self):
@@ -593,6 +877,210 @@ class Finset(Component):
         self.number_of_fins = len(self.components)
 
 
+class Thrustcurve(MutableSequence):
+    """Thrust of an engine as a function of time.
+
+    Samples are stored column-wise: one packed array of times and one of
+    thrusts (plus any extra per-sample columns, like mass), so the numeric
+    code in :class:`.Engine` can work straight off of the columns. For
+    convenience the curve is also a mutable sequence of samples, where each
+    sample is a dict with a time ``'t'`` and a ``'thrust'``. Samples (and
+    slices, which are lists of samples) read from the curve are copies: to
+    change one, assign it back with ``curve[i] = {...}``.
+
+    :param points: (Optional) iterable of sample dicts to start with
+
+    :example:
+
+    >>> from openrocketdoc.document import *
+    >>> curve = Thrustcurve()
+    >>> curve.add_point(0, 10.5)
+    >>> curve.append({'t': 1.2, 'thrust': 0})
+    >>> curve[1]
+    {'t': 1.2, 'thrust': 0.0}
+    >>> curve[1] = {'t': 1.2, 'thrust': 2}
+    >>> list(curve.thrust)
+    [10.5, 2.0]
+
+    **Members:**
+    """
+
+    __slots__ = ('_t', '_thrust', '_extra')
+
+    # mutable, compares by value
+    __hash__ = None
+
+    def __init__(self, points=()):
+        self._t = array('d')
+        self._thrust = array('d')
+        self._extra = {}
+        self.extend(points)
+
+    @property
+    def t(self):
+        """**[s]** Time of each sample. This is a copy, change the curve
+        through its methods.
+        """
+        return array('d', self._t)
+
+    @property
+    def thrust(self):
+        """**[N]** Thrust at each sample. This is a copy, change the curve
+        through its methods.
+        """
+        return array('d', self._thrust)
+
+    @property
+    def extra(self):
+        """Any other per-sample columns, by name. These are copies, change the
+        curve through its methods.
+        """
+        return dict((key, array('d', col)) for key, col in self._extra.items())
+
+    def __repr__(self):
+        return "<openrocketdoc.document.Thrustcurve (%d points)>" % len(self._t)
+
+    def __len__(self):
+        return len(self._t)
+
+    def __iter__(self):
+        for i in range(len(self._t)):
+            yield self._point(i)
+
+    def __eq__(self, other):
+        if isinstance(other, (Thrustcurve, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            # a list of samples, like slicing a list would give
+            return [self._point(j) for j in range(len(self._t))[i]]
+        if i < 0:
+            i += len(self._t)
+        if not 0 <= i < len(self._t):
+            raise IndexError("thrustcurve index out of range")
+        return self._point(i)
+
+    def __setitem__(self, i, point):
+        if isinstance(i, slice):
+            points = list(self)
+            points[i] = list(point)
+            self._set_points(points)
+        else:
+            if i < 0:
+                i += len(self._t)
+            if not 0 <= i < len(self._t):
+                raise IndexError("thrustcurve assignment index out of range")
+            # new sample goes in front of the old one, which is then dropped
+            self._insert(i, point)
+            del self._t[i + 1]
+            del self._thrust[i + 1]
+            for col in self._extra.values():
+                del col[i + 1]
+        _touch()
+
+    def __delitem__(self, i):
+        del self._t[i]
+        del self._thrust[i]
+        for col in self._extra.values():
+            del col[i]
+        _touch()
+
+    def _point(self, i):
+        point = {'t': self._t[i], 'thrust': self._thrust[i]}
+        for key, col in self._extra.items():
+            point[key] = col[i]
+        return point
+
+    def _set_points(self, points):
+        """Replace every sample, without invalidating caches"""
+        self._t = array('d')
+        self._thrust = array('d')
+        self._extra = {}
+        for point in points:
+            self._insert(len(self._t), point)
+
+    def _insert(self, i, point):
+        """Add a sample in dict form before index i, without invalidating
+        caches.
+        """
+        extra = dict(point)
+        t = extra.pop('t')
+        thrust = extra.pop('thrust')
+        n = len(self._t)
+        self._t.insert(i, t)
+        self._thrust.insert(i, thrust)
+        for key, col in self._extra.items():
+            col.insert(i, extra.pop(key, 0))
+        for key, val in extra.items():
+            # new column, the other samples don't have it
+            col = array('d', [0] * n)
+            col.insert(i, val)
+            self._extra[key] = col
+
+    def insert(self, i, point):
+        """Add a sample in dict form before index i.
+
+        :param int i: index to insert before
+        :param dict point: sample with a time ``'t'`` and a ``'thrust'``
+        """
+        self._insert(i, point)
+        _touch()
+
+    def add_point(self, t, thrust, **extra):
+        """Add a sample to the end of the curve.
+
+        :param `float [s]` t: time of the sample
+        :param `float [N]` thrust: thrust at that time
+        :\**kwargs: any other numbers that describe the sample (e.g., mass)
+        """
+        extra['t'] = t
+        extra['thrust'] = thrust
+        self.insert(len(self._t), extra)
+
+    def set_curve(self, t, thrust, **extra):
+        """Replace the whole curve with new samples.
+
+        :param t: **[s]** sequence of sample times
+        :param thrust: **[N]** sequence of thrusts, same length as t
+        :\**kwargs: any other per-sample columns (e.g., mass), same length as t
+        """
+        self._t = array('d', t)
+        self._thrust = array('d', thrust)
+        self._extra = dict((key, array('d', col)) for key, col in extra.items())
+        _touch()
+
+    def extend(self, points):
+        """Add samples in dict form to the end of the curve.
+
+        :param points: iterable of sample dicts
+        """
+        for point in points:
+            self._insert(len(self._t), point)
+        _touch()
+
+    def clear(self):
+        """Remove every sample"""
+        self._set_points(())
+        _touch()
+
+    def sort(self, key=None, reverse=False):
+        """Sort the samples in place, by time unless a key is given.
+
+        :param key: (Optional) function of a sample dict to sort by
+        :param bool reverse: sort in descending order
+        """
+        self._set_points(sorted(self, key=key or itemgetter('t'), reverse=reverse))
+        _touch()
+
+
 class Engine(object):
     """The business end of the rocket.
 
@@ -609,6 +1097,10 @@ class Engine(object):
     **Members:**
     """
 
+    __slots__ = ('name', 'manufacturer', 'comments', 'throat_diameter', '_Isp', '_length', '_diameter', '_I_total',
+                 '_thrust_avg', '_thrust_peak', '_t_burn', '_mass_frac', '_m_fuel', '_m_ox', '_m_system', 'tanks',
+                 '_thrustcurve', '_cache', '_cache_generation')
+
     def __init__(self, name):
         self.name = name
         self.manufacturer = ""
@@ -627,27 +1119,88 @@ class Engine(object):
         self._m_ox = None
         self._m_system = 0
 
+        self._cache = {}
+        self._cache_generation = None
         self.tanks = []
+        """List of tanks (or motor casings) in the engine system. Each tank is
+        a dict with a **[kg]** ``'mass'``, **[m]** ``'length'`` and **[m]**
+        ``'diameter'``."""
+
         self.thrustcurve = []
 
     def __repr__(self):
         return '<openrocketdoc.document.Engine "%s">' % self.name
 
+    @_memoized
+    def _curve_stats(self):
+        """Total impulse, peak thrust and burn time of the thrustcurve,
+        computed in one go and reused until the curve changes.
+        """
+        curve = self.thrustcurve
+        return _integrate_curve(curve._t, curve._thrust)
+
+    def _tank_stats(self):
+        """Total length, largest diameter and total mass of the tanks, in one
+        pass. Not cached: tanks are plain dicts that can be edited in place,
+        and an engine only has a handful of them.
+        """
+        length = 0
+        diameter = 0
+        mass = 0
+        for tank in self.tanks:
+            length += tank['length']
+            diameter = max(diameter, tank['diameter'])
+            mass += tank['mass']
+        return length, diameter, mass
+
     def thrust(self, t):
+        """**[N]** Thrust at time t **[s]** into the burn. Linearly
+        interpolated from the thrustcurve, and zero outside of it. With no
+        thrustcurve the engine is taken to burn at its average thrust.
+
+        :param `float [s]` t: time since ignition
+        """
         if not self.thrustcurve:
             return self.thrust_avg
 
+        times = self.thrustcurve._t
+        thrusts = self.thrustcurve._thrust
+        if t < times[0] or t > times[-1]:
+            return 0
+
+        # index of the first sample after t
+        i = bisect_right(times, t)
+        if i == len(times):
+            return thrusts[-1]
+        t0 = times[i - 1]
+        f0 = thrusts[i - 1]
+        return f0 + (thrusts[i] - f0) * (t - t0) / (times[i] - t0)
+
     def make_thrustcurve(self, points=3):
-        tc = []
+        tc = Thrustcurve()
         if not self.thrustcurve:
+            # Flat thrust, fill the columns in one go
             t_inc = self.t_burn / float(points)
-            for i in range(points):
-                t = i * t_inc
-                tc.append({'t': t, 'thrust': self.thrust(0)})
+            tc.set_curve([i * t_inc for i in range(points)], [self.thrust(0)] * points)
         else:
             tc = self.thrustcurve
         return tc
 
+    @property
+    def thrustcurve(self):
+        """The :class:`.Thrustcurve` of the engine, if known. Can be set from
+        a list of samples, each a dict with a time **[s]** ``'t'`` and a
+        thrust **[N]** ``'thrust'``.
+        """
+        return self._thrustcurve
+
+    @thrustcurve.setter
+    def thrustcurve(self, curve):
+        if type(curve) is not Thrustcurve:
+            curve = Thrustcurve(curve)
+        self._thrustcurve = curve
+        _touch()
+
     @property
     def length(self):
         """**[m]** Length of the engine, be that the actual length of a self-contained
@@ -658,8 +1211,7 @@ class Engine(object):
             return self._length
 
         # if no length is set directly, report it being the length of the system
-        l = sum([tank['length'] for tank in self.tanks])
-        return l
+        return self._tank_stats()[0]
 
     @length.setter
     def length(self, l):
@@ -673,15 +1225,14 @@ class Engine(object):
             return self._diameter
 
         # if no diameter is set directly, report it being the max diameter of the system
-        if self.tanks:
-            return max([tank['diameter'] for tank in self.tanks])
-        return 0
+        return self._tank_stats()[1]
 
     @diameter.setter
     def diameter(self, val):
         self._diameter = val
 
     @property
+    @_memoized
     def Isp(self):
         """**[s]** Average Specific Impulse (Isp) of the engine. Either computed from a
         thrust curve or can be set directly and used to compute theoretical
@@ -689,42 +1240,39 @@ class Engine(object):
         """
         if self._Isp is not None:
             return self._Isp
-        if self.m_prop > 0:
-            return self.I_total/(self.m_prop * 9.80665)
-        return 0
+        m_prop = self.m_prop
+        return self.I_total * INV_G0 / m_prop if m_prop > 0 else 0
 
     @Isp.setter
     def Isp(self, val):
         self._Isp = val
+        _touch()
 
     @property
+    @_memoized
     def m_prop(self):
         """**[kg]** Mass of the propellent in a loaded engine. This is total mass of
         the fuel and oxidiser.
         """
 
-        # Trivial case, we already know the exact mass
-        if type(self._m_fuel) is float and type(self._m_ox) is float:
-            return self._m_fuel + self._m_ox
+        # Trivial case, we already know the mass of the fuel and/or oxidiser
+        if self._m_fuel is not None or self._m_ox is not None:
+            return (self._m_fuel or 0.0) + (self._m_ox or 0.0)
 
         # We might know enough to compute:
         if self._Isp and self._thrust_avg:
             return self.I_total / self.V_e
-
-        if self._m_fuel is None and self._m_ox is None:
-            return 0
-        if self._m_fuel is None:
-            return self._m_ox
-        if self._m_ox is None:
-            return self._m_fuel
+        return 0
 
     @m_prop.setter
     def m_prop(self, val):
         # we must not know much about the system
         self._m_fuel = val / 2.0
         self._m_ox = val / 2.0
+        _touch()
 
     @property
+    @_memoized
     def thrust_avg(self):
         """**[N]** Average thrust of the motor over the length of it's nominal burn.
         Either computed from a thrust curve, or can be set directly to use in
@@ -733,18 +1281,18 @@ class Engine(object):
         # if we know the burntime and total impulse then we can compute
         # otherwise return the value stored in _thrust_avg
         # other-otherwise give up (return 0)
-        if not self.thrustcurve:
-            if self._thrust_avg is not None:
-                return self._thrust_avg
-            return 0
-        return self.I_total / self.t_burn
+        if self.thrustcurve:
+            return self.I_total / self.t_burn
+        return self._thrust_avg or 0
 
     @thrust_avg.setter
     def thrust_avg(self, val):
         # set this directly if a thrustcurve isn't available
         self._thrust_avg = val
+        _touch()
 
     @property
+    @_memoized
     def I_total(self):
         """**[N·s]** Total impulse of the engine over a nominal burn. Either computer
         from a thrust curve, or can be set directly to use in computing
@@ -753,14 +1301,7 @@ class Engine(object):
         # if we have a thrust curve, compute directly
         if self.thrustcurve:
             # Trapezoidal rule numeric ingratiation
-            itot = 0
-            for i, t in enumerate(self.thrustcurve[:-1]):
-                x = t['t']
-                x_1 = self.thrustcurve[i+1]['t']
-                f_x = t['thrust']
-                f_x1 = self.thrustcurve[i+1]['thrust']
-                itot += (x_1 - x) * (f_x1 + f_x)
-            return itot / 2.0
+            return self._curve_stats()[0]
 
         # else try the override value
         if self._I_total is not None:
@@ -779,8 +1320,10 @@ class Engine(object):
     @I_total.setter
     def I_total(self, val):
         self._I_total = val
+        _touch()
 
     @property
+    @_memoized
     def t_burn(self):
         """**[s]** Burn time. The time that it takes to burn all the propellent in a
         nominal burn. Either computed from a thrust curve or can be set directly for
@@ -789,29 +1332,33 @@ class Engine(object):
 
         # if we have a thrust curve, compute directly
         if self.thrustcurve:
-            return self.thrustcurve[-1]['t']
+            return self._curve_stats()[2]
 
         # else try the override value
         if self._t_burn is not None:
             return self._t_burn
 
         # compute from average thrust, ISP and mass
-        if self.V_e > 0 and self.m_prop > 0:
-            mdot = self.thrust_avg / (self.V_e)
-            return self.m_prop / mdot
+        V_e = self.V_e
+        m_prop = self.m_prop
+        if V_e > 0 and m_prop > 0:
+            mdot = self.thrust_avg / V_e
+            return m_prop / mdot
 
         return 0
 
     @t_burn.setter
     def t_burn(self, val):
         self._t_burn = val
+        _touch()
 
     @property
+    @_memoized
     def thrust_peak(self):
         """**[N]** Peak thrust during a nominal burn.
         """
         if self.thrustcurve:
-            return max([t['thrust'] for t in self.thrustcurve])
+            return self._curve_stats()[1]
 
         if self._thrust_peak is not None:
             return self._thrust_peak
@@ -824,6 +1371,7 @@ class Engine(object):
     @thrust_peak.setter
     def thrust_peak(self, val):
         self._thrust_peak = val
+        _touch()
 
     @property
     def m_frac(self):
@@ -831,43 +1379,50 @@ class Engine(object):
         loaded mass of the engine system and the empty weight. Often an
         important figure of merit in designing a rocket.
         """
-        if self.m_init > 0:
-            return (self.m_prop / self.m_init) * 100.0
+        if self._mass_frac is not None:
+            return self._mass_frac
+
+        m_init = self.m_init
+        if m_init > 0:
+            return (self.m_prop / m_init) * 100.0
         return 0
 
     @m_frac.setter
     def m_frac(self, val):
-        self._m_frac = val
+        self._mass_frac = val
+        _touch()
 
     @property
+    @_memoized
     def V_e(self):
         """**[m/s]** Effective velocity (average) of the exhaust gasses of the
         engine.
         """
-        return self.Isp * 9.80665
+        return self.Isp * G0
 
     @V_e.setter
     def V_e(self, val):
-        self._Isp = val / 9.80665
+        self._Isp = val * INV_G0
+        _touch()
 
     @property
     def m_init(self):
         """**[kg]** Initial weight of the engine system, including propellent.
         """
-        m_tanks = sum([tank['mass'] for tank in self.tanks])
-        return self.m_prop + m_tanks + self._m_system
+        return self.m_prop + self._tank_stats()[2] + self._m_system
 
     @property
+    @_memoized
     def nar_code(self):
         """The NAR code for a rocket motor is a letter code for the total
         impulse.
         """
 
-        if self.I_total <= 0:
+        I_total = self.I_total
+        if I_total <= 0:
             return ''
 
-        # how many times we double 2.5 Ns
-        nar_i = int(log(self.I_total/2.5)/log(2))
+        nar_i = _nar_index(I_total)
 
         # ASCII math :)
         if nar_i < 26:
@@ -875,26 +1430,37 @@ class Engine(object):
         return 'A' + chr(66 + nar_i - 26)
 
     @property
+    @_memoized
     def nar_percent(self):
         """What percent of the NAR impulse class is the motor
         """
-        nar_i = int(log(self.I_total/2.5)/log(2))
+        I_total = self.I_total
+        nar_i = _nar_index(I_total)
 
-        max_class = (2.5*2**(nar_i+1))
-        min_class = (2.5*2**nar_i)
+        # each class spans double the impulse of the one before
+        min_class = 2.5*2**nar_i
+        max_class = min_class * 2
 
-        nar_percent = (self.I_total - min_class)/(max_class - min_class)
+        nar_percent = (I_total - min_class)/(max_class - min_class)
         return nar_percent * 100.0
 
     @property
+    @_memoized
     def constrained(self):
         """Is the system fully described?
 
         :rtype: boolean
         """
-        if self.I_total > 0:
-            return True
-        return False
+        # Answer from what was set directly if we can, same order as I_total,
+        # and only work out the total impulse when we have to
+        if not self.thrustcurve:
+            if self._I_total is not None:
+                return self._I_total > 0
+            if self._thrust_avg and self._t_burn:
+                return self._thrust_avg * self._t_burn > 0
+            if not self._Isp:
+                return False
+        return self.I_total > 0
 
     @property
     def name_slug(self):
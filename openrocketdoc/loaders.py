@@ -3,9 +3,17 @@
 from __future__ import print_function
 from zipfile import ZipFile
 from math import pi
-import xml.etree.ElementTree as ET
+import re
+try:
+    # C parser on Python 2, Python 3 uses it automatically
+    import xml.etree.cElementTree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 import openrocketdoc.document as rdoc
 
+# Finds any digit in a line of text
+_digit = re.compile('[0-9]')
+
 
 class FilelikeLoader(object):
     """Baseclass for classes that will load a file, or file-like object. We
@@ -16,14 +24,19 @@ class FilelikeLoader(object):
     def load(self, filelike):
         """Parse the file into a OpenRocketDoc representation.
 
-        :param filelike filelike: File handle or str filename to open and parse
+        :param filelike filelike: File handle, path, str filename to open and
+            parse, or a str of the file contents
         """
 
         if hasattr(filelike, 'read'):
             # it's probably a file handler, or something like that
             return self._load(filelike.read())
-        elif type(filelike) is str and len(filelike) > 255:
-            # it's maybe a str containing the file contents?
+        elif hasattr(filelike, '__fspath__'):
+            # a path object (e.g., pathlib.Path), definitely a filename
+            with open(filelike, 'r') as fh:
+                return self._load(fh.read())
+        elif (b'\n' if isinstance(filelike, bytes) else '\n') in filelike:
+            # filenames don't span lines, it's a str of the file contents
             return self._load(filelike)
         else:
             # maybe a filename?
@@ -43,14 +56,16 @@ class RaspEngine(FilelikeLoader):
         self.engine = rdoc.Engine("Imported RASP Egine")
 
     def _load(self, file_str):
-        comments = ""
+        comments = []
         start_data = False  # flag to throw after we finish reading the header
-        for line in file_str.split('\n'):
-            if len(line) < 1:
+        times = []
+        thrusts = []
+        for line in file_str.splitlines():
+            if not line:
                 continue  # blank line
-            if line[0] == ';':
+            if line.startswith(';'):
                 if not start_data:
-                    comments += line[1:] + "\n"
+                    comments.append(line[1:] + "\n")
             else:
                 if not start_data:
                     # This is the first data line, has metadata
@@ -74,13 +89,14 @@ class RaspEngine(FilelikeLoader):
                     start_data = True
                 else:
                     # Thrustcuve data:
-                    if any(char.isdigit() for char in line):
-                        fields = line.split(' ')
-                        time = float(fields[0].strip())
-                        thrust = float(fields[1].strip())
-                        self.engine.thrustcurve.append({'t': time, 'thrust': thrust})
-
-        self.engine.comments = comments
+                    if _digit.search(line):
+                        fields = line.split()
+                        times.append(fields[0])
+                        thrusts.append(fields[1])
+
+        # Convert the whole curve in one go
+        self.engine.thrustcurve.set_curve(map(float, times), map(float, thrusts))
+        self.engine.comments = "".join(comments)
         return self.engine
 
 
@@ -107,6 +123,13 @@ class RockSimEngine(FilelikeLoader):
         {'name': u"Length", 'key': 'len', 'type': float, 'convert': 1e-3},
     ]
 
+    # The defs above split by type, with the conversion factor filled in
+    # (default to 1 for no conversion factor)
+    rse_float_defs = tuple((d['name'], d['key'], d.get('convert', 1))
+                           for d in rse_engine_defs if d['type'] is float)
+    rse_str_defs = tuple((d['name'], d['key'])
+                         for d in rse_engine_defs if d['type'] is not float)
+
     def __init__(self):
         self.engine = rdoc.Engine("Imported RockSim Engine")
 
@@ -115,15 +138,12 @@ class RockSimEngine(FilelikeLoader):
         rse = root[0][0]
         rse_dict = {}
 
-        for definition in self.rse_engine_defs:
-            if definition['type'] is float:
-                # grab number out of XML
-                val = float(rse.get(definition['key']))
-                # convert to MKS
-                val = val * definition.get('convert', 1)  # default to 1 for no conversion factor
-                rse_dict[definition['name']] = val
-            else:
-                rse_dict[definition['name']] = rse.get(definition['key'])
+        # grab numbers out of XML and convert to MKS
+        attrs = rse.attrib
+        for name, key, convert in self.rse_float_defs:
+            rse_dict[name] = float(attrs[key]) * convert
+        for name, key in self.rse_str_defs:
+            rse_dict[name] = attrs.get(key)
 
         # Build rdoc engine from rse defs
         self.engine.name = rse_dict["Name"]
@@ -143,12 +163,13 @@ class RockSimEngine(FilelikeLoader):
             if element.tag == "comments":
                 self.engine.comments = element.text
             if element.tag == "data":
-                for datapoint in element:
-                    time = float(datapoint.get('t'))
-                    thrust = float(datapoint.get('f'))
-                    mass = float(datapoint.get('m', 0)) / 1000.0  # convert to kilograms
-                    cg = float(datapoint.get('cg', 0)) / 1000.0  # convert to meters
-                    self.engine.thrustcurve.append({'t': time, 'thrust': thrust, 'mass': mass, 'cg': cg})
+                datapoints = [datapoint.attrib for datapoint in element]
+                self.engine.thrustcurve.set_curve(
+                    [float(d['t']) for d in datapoints],
+                    [float(d['f']) for d in datapoints],
+                    mass=[float(d.get('m', 0)) / 1000.0 for d in datapoints],  # convert to kilograms
+                    cg=[float(d.get('cg', 0)) / 1000.0 for d in datapoints],  # convert to meters
+                )
 
         return self.engine
 
@@ -166,6 +187,42 @@ class Openrocket(object):
 
     """
 
+    # Plain fields of each part: OpenRocket tag -> (attribute, type). A type
+    # of None keeps the element text as is.
+    nosecone_fields = {
+        'shapeparameter': ('shape_parameter', float),
+        'length': ('length', float),
+        'thickness': ('thickness', float),
+    }
+
+    bodytube_fields = {
+        'name': ('name', None),
+        'length': ('length', float),
+        'thickness': ('thickness', float),
+    }
+
+    mass_fields = {
+        'name': ('name', None),
+        'mass': ('mass', float),
+        'position': ('center', float),
+        'packedlength': ('length', float),
+    }
+
+    streamer_fields = {
+        'name': ('name', None),
+        'position': ('center', float),
+        'packedlength': ('length', float),
+    }
+
+    fin_fields = {
+        'rootchord': ('root', float),
+        'tipchord': ('tip', float),
+        'height': ('span', float),
+        'sweeplength': ('sweep', float),
+        'material': ('material_name', None),
+        'thickness': ('thickness', float),
+    }
+
     def __init__(self):
         # list of OpenRocket parts we care about
         self.part_types = {
@@ -192,10 +249,21 @@ class Openrocket(object):
     def _read_color(self, node):
         """Translate OpenRocket's color XML element node to a RGB tuple
         """
-        r = int(node.get('red', 0))
-        g = int(node.get('green', 0))
-        b = int(node.get('blue', 0))
-        return (r, g, b)
+        attrs = node.attrib
+        return (int(attrs.get('red', 0)), int(attrs.get('green', 0)), int(attrs.get('blue', 0)))
+
+    def _read_field(self, component, element, fields):
+        """Set a plain field on a component from an element, if the element
+        is in the fields table.
+
+        :returns: True if the element was handled
+        """
+        field = fields.get(element.tag)
+        if field is None:
+            return False
+        attr, kind = field
+        setattr(component, attr, element.text if kind is None else kind(element.text))
+        return True
 
     def _load_nosecone(self, tree):
         # defaults:
@@ -203,43 +271,40 @@ class Openrocket(object):
 
         # Read data
         for element in tree:
-            if element.tag == 'shape':
+            if self._read_field(nose, element, self.nosecone_fields):
+                continue
+            tag = element.tag
+            if tag == 'shape':
                 shape_str = element.text
                 if 'ogive' in shape_str.lower():
                     nose.shape = rdoc.Noseshape.TANGENT_OGIVE
                 elif 'cone' in shape_str.lower():
                     nose.shape = rdoc.Noseshape.CONE
-            if element.tag == 'shapeparameter':
-                nose.shape_parameter = float(element.text)
-            if element.tag == 'length':
-                nose.length = float(element.text)
-            if element.tag == 'thickness':
-                nose.thickness = float(element.text)
-            if element.tag == 'finish':
+            elif tag == 'finish':
                 nose.surface_roughness = self._read_surface(element.text)
-            if element.tag == 'aftradius':
+            elif tag == 'aftradius':
                 if 'auto' not in element.text:
                     self.radius = float(element.text)
-            if element.tag == 'material':
+            elif tag == 'material':
                 nose.material_name = element.text
                 nose.density = float(element.get('density', 0))
-            if element.tag == 'color':
+            elif tag == 'color':
                 nose.color = self._read_color(element)
-            if element.tag == 'linestyle':
+            elif tag == 'linestyle':
                 nose.add_class_tag("OpenRocket", "linestyle:"+element.text)
-            if element.tag == 'aftshoulderradius':
+            elif tag == 'aftshoulderradius':
                 if self.radius is None:
                     self.radius = 0
                 self.radius += float(element.text)
                 nose.add_class_tag("OpenRocket", "aftshoulderradius:"+element.text)
-            if element.tag == 'aftshoulderlength':
+            elif tag == 'aftshoulderlength':
                 nose.add_class_tag("OpenRocket", "aftshoulderlength:"+element.text)
-            if element.tag == 'aftshoulderthickness':
+            elif tag == 'aftshoulderthickness':
                 if self.radius is None:
                     self.radius = 0
                 self.radius += (float(element.text) * 2.0)
                 nose.add_class_tag("OpenRocket", "aftshoulderthickness:"+element.text)
-            if element.tag == 'aftshouldercapped':
+            elif tag == 'aftshouldercapped':
                 nose.add_class_tag("OpenRocket", "aftshouldercapped:"+element.text)
 
         if self.radius is not None:
@@ -252,30 +317,27 @@ class Openrocket(object):
 
         # Read data
         for element in tree:
-            if element.tag == 'name':
-                tube.name = element.text
-            if element.tag == 'length':
-                tube.length = float(element.text)
-            if element.tag == 'thickness':
-                tube.thickness = float(element.text)
-            if element.tag == 'finish':
+            if self._read_field(tube, element, self.bodytube_fields):
+                continue
+            tag = element.tag
+            if tag == 'finish':
                 tube.surface_roughness = self._read_surface(element.text)
-            if element.tag == 'material':
+            elif tag == 'material':
                 tube.material_name = element.text
                 tube.density = float(element.get('density', 0))
-            if element.tag == 'color':
+            elif tag == 'color':
                 tube.color = self._read_color(element)
-            if element.tag == 'radius':
+            elif tag == 'radius':
                 if 'auto' not in element.text:
                     self.radius = float(element.text)
 
         if self.radius is not None:
             tube.diameter = self.radius * 2.0
 
-        # Compute mass:
-        r1 = self.radius
-        r2 = r1 - tube.thickness
-        tube.mass = tube.density * (pi * tube.length * (r1**2 - r2**2))
+        # Compute mass. Shell area is r1^2 - r2^2, where r2 = r1 - thickness,
+        # which factors to (2*r1 - thickness)*thickness
+        t = tube.thickness
+        tube.mass = tube.density * (pi * tube.length * (2.0 * self.radius - t) * t)
 
         return tube
 
@@ -286,17 +348,12 @@ class Openrocket(object):
         mass = rdoc.Mass('mass', 0)
 
         for element in tree:
-            if element.tag == 'name':
-                mass.name = element.text
-            if element.tag == 'mass':
-                mass.mass = float(element.text)
-            if element.tag == 'position':
-                mass.center = float(element.text)
-            if element.tag == 'packedlength':
-                mass.length = float(element.text)
-            if element.tag == 'packedradius':
+            if self._read_field(mass, element, self.mass_fields):
+                continue
+            tag = element.tag
+            if tag == 'packedradius':
                 mass.diameter = 2 * float(element.text)
-            if element.tag == 'color':
+            elif tag == 'color':
                 mass.color = self._read_color(element)
 
         # Record the original OpenRocket type as a tag
@@ -312,17 +369,14 @@ class Openrocket(object):
         mass = rdoc.Mass('mass', 0)
 
         for element in tree:
-            if element.tag == 'name':
-                mass.name = element.text
-            if element.tag == 'position':
-                mass.center = float(element.text)
-            if element.tag == 'packedlength':
-                mass.length = float(element.text)
-            if element.tag == 'packedradius':
+            if self._read_field(mass, element, self.streamer_fields):
+                continue
+            tag = element.tag
+            if tag == 'packedradius':
                 mass.diameter = 2 * float(element.text)
-            if element.tag == 'color':
+            elif tag == 'color':
                 mass.color = self._read_color(element)
-            if element.tag == 'linestyle':
+            elif tag == 'linestyle':
                 mass.add_class_tag("OpenRocket", "linestyle:"+element.text)
 
         # Record the original OpenRocket type as a tag
@@ -341,23 +395,14 @@ class Openrocket(object):
         number_of_fins = 0
 
         for element in tree:
-            if element.tag == 'name':
+            if self._read_field(fin, element, self.fin_fields):
+                continue
+            tag = element.tag
+            if tag == 'name':
                 name = element.text
-            if element.tag == 'rootchord':
-                fin.root = float(element.text)
-            if element.tag == 'tipchord':
-                fin.tip = float(element.text)
-            if element.tag == 'height':
-                fin.span = float(element.text)
-            if element.tag == 'sweeplength':
-                fin.sweep = float(element.text)
-            if element.tag == 'material':
-                fin.material_name = element.text
-            if element.tag == 'thickness':
-                fin.thickness = float(element.text)
-            if element.tag == 'fincount':
+            elif tag == 'fincount':
                 number_of_fins = int(element.text)
-            if element.tag == 'color':
+            elif tag == 'color':
                 fin.color = self._read_color(element)
 
         finset = rdoc.Finset(name, fin, number_of_fins)
@@ -365,59 +410,89 @@ class Openrocket(object):
         return finset
 
     def _subcomponent_walk(self, tree):
-        """My mom always said, never loop when you can recurse"""
+        """Read every part we know about in a <subcomponents> element, and all
+        the parts inside those, in document order.
 
-        for subcomponent in tree:
-            # We'll only decode things we know about
-            if subcomponent.tag in self.part_types.keys():
+        My mom always said, never loop when you can recurse. But a loop with a
+        stack of open <subcomponents> doesn't care how deep the rocket goes.
 
-                component = self.part_types[subcomponent.tag](subcomponent)
-
-                for element in subcomponent:
-                    if element.tag == 'subcomponents':
-                        component.components = [sub for sub in self._subcomponent_walk(element)]
+        :returns: list of components
+        """
+        part_types = self.part_types
+        components = []
+
+        # (children still to read, list they go into)
+        stack = [(iter(tree), components)]
+        while stack:
+            children, parts = stack[-1]
+            for subcomponent in children:
+                # We'll only decode things we know about
+                load_part = part_types.get(subcomponent.tag)
+                if load_part is None:
+                    continue
+
+                component = load_part(subcomponent)
+                parts.append(component)
+
+                # The loader has already been through the children, so jump
+                # straight to any that this part holds, and read those next
+                element = subcomponent.find('subcomponents')
+                if element is not None:
+                    component.components = []
+                    stack.append((iter(element), component.components))
+                    break
+            else:
+                # done with this level
+                stack.pop()
 
-                yield component
-            elif subcomponent.tag == 'subcomponents':
-                yield [sub for sub in self._subcomponent_walk(subcomponent)]
+        return components
 
     def load(self, filename):
         """Read an OpenRocket file"""
 
-        zf = ZipFile(filename)
-        root = ET.fromstring(zf.read(zf.namelist()[0]))
+        # Stream the document out of the archive. There should be a 'rocket'
+        # and 'simulation' tags. We only care about 'rocket', so anything else
+        # at the top level is dropped as soon as it's been parsed, and we stop
+        # reading once we have the rocket. OpenRocket writes it first, ahead
+        # of the (possibly huge) simulation data.
+        root = None
+        rocket = None
+        depth = 0
+        with ZipFile(filename) as zf:
+            with zf.open(zf.infolist()[0]) as orkfile:
+                for event, element in ET.iterparse(orkfile, events=('start', 'end')):
+                    if event == 'start':
+                        if root is None:
+                            root = element
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 1:
+                            if element.tag == 'rocket':
+                                rocket = element
+                                break
+                            else:
+                                root.remove(element)
 
         self.or_version = root.attrib['version']
 
-        # Walk tree, there should be a 'rocket' and 'simulation tags'. We only
-        # care about 'rocket'. After that there is a little metadata and then
-        # components.
-        for element in root:
-            if element.tag == 'rocket':
-
-                # We found a rocket! Create a document
-                ordoc = rdoc.Rocket("Imported OpenRocket File")  # default name
-
-                for orkrocket in element:
-                    if orkrocket.tag == 'name':
-                        # This rocket has a name
-                        ordoc.name = orkrocket.text
-
-                    if orkrocket.tag == 'subcomponents':
-                        # This rocket has stages
-                        for orkstage in orkrocket:
-                            if orkstage.tag == 'stage':
-                                # Create a stage, default name is stage number
-                                stage = rdoc.Stage("stage {0}".format(len(ordoc.stages)))
-
-                                for stage_parts in orkstage:
-                                    if stage_parts.tag == 'name':
-                                        stage.name = stage_parts.text
-                                    if stage_parts.tag == 'subcomponents':
-                                        # Recurse down through all components
-                                        stage.components = [part for part in self._subcomponent_walk(stage_parts)]
-
-                                # Append to rocket
-                                ordoc.stages.append(stage)
+        # After the rocket name there is a little metadata and then components.
+        # ElementTree compiles and caches these paths.
+
+        # We found a rocket! Create a document
+        ordoc = rdoc.Rocket(rocket.findtext('name', "Imported OpenRocket File"))
+
+        # This rocket has stages
+        for orkstage in rocket.iterfind('subcomponents/stage'):
+            # Create a stage, default name is stage number
+            stage = rdoc.Stage(orkstage.findtext('name', "stage {0}".format(len(ordoc.stages))))
+
+            # Recurse down through all components
+            parts = orkstage.find('subcomponents')
+            if parts is not None:
+                stage.components = self._subcomponent_walk(parts)
+
+            # Append to rocket
+            ordoc.stages.append(stage)
 
         return ordoc
@@ -12,12 +12,69 @@ N2LBF = 0.224809
 KG2LB = 2.20462
 
 
+def _pretty_xml(root):
+    """Return an ElementTree element as an indented XML document str.
+    """
+    if hasattr(ET, 'indent'):
+        # Python 3.9+ can indent the tree in place, no need to parse it again
+        ET.indent(root, space="  ")
+        return '<?xml version="1.0" ?>\n' + ET.tostring(root, encoding="unicode") + '\n'
+
+    xmldoc = minidom.parseString(ET.tostring(root, encoding="UTF-8"))
+    return xmldoc.toprettyxml(indent="  ")
+
+
 class Document(object):
     """Write Open Rocket Doc
     """
 
     def __init__(self):
-        pass
+        # Component types that write more than a name and type, and the
+        # method that adds their fields
+        self.part_types = {
+            rdoc.Nosecone: self._nosecone_dict,
+            rdoc.Bodytube: self._bodytube_dict,
+            rdoc.Finset: self._finset_dict,
+            rdoc.Fin: self._fin_dict,
+        }
+
+    def _color_str(self, color):
+        return '['+str(color[0])+','+str(color[1])+','+str(color[2])+']'
+
+    def _nosecone_dict(self, component, c):
+        c['shape'] = component.shape.name
+        c['shape_parameter'] = component.shape_parameter
+        if component.thickness > 0:
+            c['thickness'] = component.thickness
+        if component.surface_roughness > 0:
+            c['surface'] = component.surface_roughness
+        c['mass'] = component.component_mass
+        c['length'] = component.length
+        c['diameter'] = component.diameter
+        if component.color:
+            c['color'] = self._color_str(component.color)
+
+    def _bodytube_dict(self, component, c):
+        c['mass'] = component.component_mass
+        c['length'] = component.length
+        c['diameter'] = component.diameter
+        if component.thickness > 0:
+            c['thickness'] = component.thickness
+        if component.surface_roughness > 0:
+            c['surface'] = component.surface_roughness
+        if component.color:
+            c['color'] = self._color_str(component.color)
+
+    def _finset_dict(self, component, c):
+        c['fin'] = self._component_dict(component.components[0])
+        c['num_of_fins'] = len(component.components)
+
+    def _fin_dict(self, component, c):
+        c['root_chord'] = component.root
+        c['tip_chord'] = component.tip
+        c['span'] = component.span
+        c['sweepangle'] = component.sweepangle
+        c['mass'] = component.component_mass
 
     def _component_dict(self, component):
         """For recursively building a tree of components.
@@ -31,40 +88,10 @@ class Document(object):
         if component.tags:
             c['tags'] = component.tags
 
-        if type(component) is rdoc.Nosecone:
-            c['shape'] = component.shape.name
-            c['shape_parameter'] = component.shape_parameter
-            if component.thickness > 0:
-                c['thickness'] = component.thickness
-            if component.surface_roughness > 0:
-                c['surface'] = component.surface_roughness
-            c['mass'] = component.component_mass
-            c['length'] = component.length
-            c['diameter'] = component.diameter
-            if component.color:
-                c['color'] = '['+str(component.color[0])+','+str(component.color[1])+','+str(component.color[2])+']'
-
-        elif type(component) is rdoc.Bodytube:
-            c['mass'] = component.component_mass
-            c['length'] = component.length
-            c['diameter'] = component.diameter
-            if component.thickness > 0:
-                c['thickness'] = component.thickness
-            if component.surface_roughness > 0:
-                c['surface'] = component.surface_roughness
-            if component.color:
-                c['color'] = '['+str(component.color[0])+','+str(component.color[1])+','+str(component.color[2])+']'
-
-        elif type(component) is rdoc.Finset:
-            c['fin'] = self._component_dict(component.components[0])
-            c['num_of_fins'] = len(component.components)
-
-        elif type(component) is rdoc.Fin:
-            c['root_chord'] = component.root
-            c['tip_chord'] = component.tip
-            c['span'] = component.span
-            c['sweepangle'] = component.sweepangle
-            c['mass'] = component.component_mass
+        # Anything else depends on the type, other types only get the above
+        add_fields = self.part_types.get(type(component))
+        if add_fields is not None:
+            add_fields(component, c)
 
         # recursion
         # However, a finset describes one fin only, no need to list them redundantly
@@ -369,7 +396,7 @@ fill:#999999;fill-opacity:1;stroke:none;"
     def _draw_component(self, doc, position, parent, component):
 
         # Nosecone ########################################################
-        if type(component) == rdoc.Nosecone:
+        if type(component) is rdoc.Nosecone:
             path = ET.SubElement(doc, 'path')
             path.attrib['id'] = "nose"
             path.attrib['style'] = "fill:none;stroke:#666666;stroke-width:4px;"
@@ -393,7 +420,7 @@ fill:#999999;fill-opacity:1;stroke:none;"
             position += component.length
 
         # Bodytube ########################################################
-        if type(component) == rdoc.Bodytube:
+        if type(component) is rdoc.Bodytube:
             # horizontal tube
             path = ET.SubElement(doc, 'rect')
             path.attrib['id'] = component.name
@@ -417,7 +444,7 @@ fill:#999999;fill-opacity:1;stroke:none;"
             position += component.length
 
         # Mass ################################################################
-        if type(component) == rdoc.Mass:
+        if type(component) is rdoc.Mass:
             path = ET.SubElement(doc, 'rect')
             path.attrib['id'] = component.name
             path.attrib['x'] = "%0.4f" % self._px(position)
@@ -427,7 +454,7 @@ fill:#999999;fill-opacity:1;stroke:none;"
             path.attrib['style'] = "opacity:1;fill:#ccdddd;fill-opacity:1;stroke:#55bbbb;stroke-width:2px;"
 
         # Fins ################################################################
-        if type(component) == rdoc.Finset:
+        if type(component) is rdoc.Finset:
             fin = component.fin
             start = position - fin.root - 0.001
             base = -parent.diameter / 2.0
@@ -495,8 +522,7 @@ fill:#999999;fill-opacity:1;stroke:none;"
             svg._draw_scale()
 
         # pretty print
-        xmldoc = minidom.parseString(ET.tostring(svg.svg, encoding="UTF-8"))
-        return xmldoc.toprettyxml(indent="  ")
+        return _pretty_xml(svg.svg)
 
 
 class JSBSimAircraft(object):
@@ -597,7 +623,7 @@ class JSBSimAircraft(object):
 
         position = 0
         for component in ordoc.stages[0].components:
-            if type(component) == rdoc.Bodytube:
+            if type(component) is rdoc.Bodytube:
 
                 # New pointmass
                 pointmass = ET.SubElement(mass_balance, 'pointmass')
@@ -627,7 +653,7 @@ class JSBSimAircraft(object):
 
                 # What about stuff in this component
                 for subcomponent in component.components:
-                    if type(subcomponent) == rdoc.Mass:
+                    if type(subcomponent) is rdoc.Mass:
                         pointmass = ET.SubElement(mass_balance, 'pointmass')
 
             # Keep running tabs on the distance from nosecone
@@ -641,7 +667,7 @@ class JSBSimAircraft(object):
         position = 0
         for component in ordoc.stages[0].components:
             for subc in component.components:
-                if type(subc) == rdoc.Engine:
+                if type(subc) is rdoc.Engine:
                     engine = subc
 
                     tank = ET.SubElement(prop, 'tank')
@@ -725,8 +751,7 @@ class JSBSimAircraft(object):
         ET.SubElement(doc, 'system')
 
         # pretty print
-        xmldoc = minidom.parseString(ET.tostring(doc, encoding="UTF-8"))
-        return xmldoc.toprettyxml(indent="  ")
+        return _pretty_xml(doc)
 
 
 class JSBSimEngine(object):
@@ -766,15 +791,13 @@ class JSBSimEngine(object):
             thrustcurve = engine.thrustcurve
 
         # First data point is at t=0, 0 prop burnt
-        tableData.text += "      %0.3f %0.3f\n" % (0.0, thrustcurve[0]['thrust'] * N2LBF)
+        tableData.text += "      %0.3f %0.3f\n" % (0.0, thrustcurve.thrust[0] * N2LBF)
 
         # Compute propellent burn, _first_ result will be at t = i+1
         itot = 0
-        for i, t in enumerate(thrustcurve[:-1]):
-            x = t['t']
-            x_1 = thrustcurve[i+1]['t']
-            f_x = t['thrust']
-            f_x1 = thrustcurve[i+1]['thrust']
+        t = thrustcurve.t
+        f = thrustcurve.thrust
+        for x, x_1, f_x, f_x1 in zip(t, t[1:], f, f[1:]):
             itot += (x_1 - x) * (f_x1 + f_x)
 
             mass = ((itot/2.0)/engine.V_e) * KG2LB
@@ -785,8 +808,7 @@ class JSBSimEngine(object):
         tableData.text += "    "
 
         # pretty print
-        xmldoc = minidom.parseString(ET.tostring(doc, encoding="UTF-8"))
-        return xmldoc.toprettyxml(indent="  ")
+        return _pretty_xml(doc)
 
 
 class RaspEngine(object):
@@ -811,23 +833,20 @@ class RaspEngine(object):
         doc += engine.comments.replace('\n', "\n;")
         doc += '\n'
 
-        # header
-        doc += ' '.join([
+        # header: name, diameter [mm], length [mm], delays, propellent mass,
+        # initial mass, manufacturer
+        doc += "%s %0.0f %0.0f 0 %0.4f %0.4f %s\n" % (
             engine.name.replace(' ', '-'),
-            "%0.0f" % (engine.diameter * 1000),
-            "%0.0f" % (engine.length * 1000),
-            "0",
-            "%0.4f" % (engine.m_prop),
-            "%0.4f" % (engine.m_init),
+            engine.diameter * 1000,
+            engine.length * 1000,
+            engine.m_prop,
+            engine.m_init,
             engine.manufacturer.replace(' ', '-'),
-        ])
-        doc += '\n'
+        )
 
-        if not engine.thrustcurve:
-            for element in engine.make_thrustcurve():
-                doc += "%0.3f %0.3f\n" % (element['t'], element['thrust'])
-        for element in engine.thrustcurve:
-            doc += "%0.3f %0.3f\n" % (element['t'], element['thrust'])
+        # thrustcurve, built as one block
+        thrustcurve = engine.make_thrustcurve()
+        doc += "".join(["%0.3f %0.3f\n" % point for point in zip(thrustcurve.t, thrustcurve.thrust)])
 
         return doc
 
@@ -890,11 +909,11 @@ class RockSimEngine(object):
 
         data = ET.SubElement(eng, 'data')
 
-        for element in engine.make_thrustcurve():
+        thrustcurve = engine.make_thrustcurve()
+        for t, thrust in zip(thrustcurve.t, thrustcurve.thrust):
             eng_data = ET.SubElement(data, 'eng-data')
-            eng_data.attrib['t'] = "%0.5f" % element['t']
-            eng_data.attrib['f'] = "%0.5f" % element['thrust']
+            eng_data.attrib['t'] = "%0.5f" % t
+            eng_data.attrib['f'] = "%0.5f" % thrust
 
         # pretty print
-        xmldoc = minidom.parseString(ET.tostring(doc, encoding="UTF-8"))
-        return xmldoc.toprettyxml(indent="  ")
+        return _pretty_xml(doc)
@@ -53,6 +53,57 @@ class TestOpenrocketdoc(unittest.TestCase):
 
         self.assertEqual(29.77, rocket.mass)
 
+    def test_rocket_mass_updates(self):
+        stage0 = document.Stage("Booster")
+        body = document.Bodytube("body", 1.5, 1)
+        stage0.components = [body]
+        rocket = document.Rocket("Rocket")
+        rocket.stages = [stage0]
+        self.assertAlmostEqual(rocket.mass, 1.5)
+
+        # changes deep in the tree are seen by the rocket
+        body.components.append(document.Mass("Flight Computer", 0.5))
+        self.assertAlmostEqual(rocket.mass, 2.0)
+        body.mass = 2.5
+        self.assertAlmostEqual(rocket.mass, 3.0)
+        body.components.pop()
+        self.assertAlmostEqual(rocket.mass, 2.5)
+        rocket.stages.append(document.Stage("Sustainer"))
+        rocket.stages[1].components = [document.Bodytube("body", 1, 1)]
+        self.assertAlmostEqual(rocket.mass, 3.5)
+        del rocket.stages[0]
+        self.assertAlmostEqual(rocket.mass, 1.0)
+
+    def test_components_copied(self):
+        stage = document.Stage("Booster")
+        components = []
+        stage.components = components
+
+        # the stage keeps its own list, edits go through stage.components
+        components.append(document.Mass("mass", 1.0))
+        self.assertEqual(len(stage.components), 0)
+        self.assertAlmostEqual(stage.mass, 0)
+        stage.components.append(components[0])
+        self.assertEqual(len(stage.components), 1)
+        self.assertAlmostEqual(stage.mass, 1.0)
+
+        # a change in another document is never mistaken for no change
+        other = document.Stage("Sustainer")
+        other.components = [document.Mass("mass", 2.0)]
+        self.assertAlmostEqual(other.mass, 2.0)
+        self.assertAlmostEqual(stage.mass, 1.0)
+
+    def test_nested_mass(self):
+        top = document.Bodytube("body", 1, 1)
+        parent = top
+        # deeper than the recursion limit
+        for i in range(2000):
+            child = document.Mass("mass %d" % i, 0.5)
+            parent.components.append(child)
+            parent = child
+        self.assertAlmostEqual(top.mass, 1001)
+        self.assertAlmostEqual(top.component_mass, 1)
+
     def test_rocket_aero_exist(self):
         rocket = document.Rocket("Rocket")
         self.assertEqual(rocket.aero_properties, {})
@@ -106,6 +157,79 @@ class TestOpenrocketdoc(unittest.TestCase):
         self.assertAlmostEqual(fin.sweep, 0.234)
         self.assertAlmostEqual(fin.sweepangle, 13.170241897951414)
 
+        # sweep from angle
+        fin.sweepangle = 45.0
+        self.assertAlmostEqual(fin.sweep, 1.0)
+        fin.sweepangle = 30.0
+        self.assertAlmostEqual(fin.sweep, 0.5773502691896257)
+
+    def test_finset(self):
+        fin = document.Fin('fin', 0.5, 0.24, 0.4, sweep=0.2, mass=0.1)
+        fin.add_class_tag("OpenRocket", "linestyle:solid")
+        finset = document.Finset("Fins", fin, 4)
+
+        self.assertEqual(finset.number_of_fins, 4)
+        self.assertEqual([f.name for f in finset.components], ["Fin 1", "Fin 2", "Fin 3", "Fin 4"])
+        self.assertAlmostEqual(finset.mass, 0.4)
+        self.assertAlmostEqual(finset.components[2].sweep, 0.2)
+
+        # fins are copies, not the prototype
+        finset.components[0].add_class_tag("OpenRocket", "other")
+        self.assertEqual(fin.tags[0]['tags'], ["linestyle:solid"])
+        self.assertEqual(fin.name, "fin")
+
+        # subclasses keep their type and anything extra they carry
+        class CantedFin(document.Fin):
+            __slots__ = ('cant',)
+
+        fin = CantedFin('fin', 0.5, 0.24, 0.4, sweep=0.2, mass=0.1)
+        fin.cant = 2.5
+        finset = document.Finset("Fins", fin, 3)
+        self.assertEqual(type(finset.components[0]), CantedFin)
+        self.assertEqual(finset.components[0].cant, 2.5)
+        self.assertEqual(finset.components[0].name, "Fin 1")
+        self.assertIsNot(finset.components[0], fin)
+
+    def test_bodytube_density(self):
+        tube = document.Bodytube("body", 0.5, 1.0, diameter=0.1)
+        self.assertEqual(tube.density, 0)
+
+        # 2 mm wall
+        tube.thickness = 0.002
+        wall_volume = 3.141592653589793 * 1.0 * (0.05**2 - 0.048**2)
+        self.assertAlmostEqual(tube.density, 0.5 / wall_volume)
+
+    def test_class_tags(self):
+        tube = document.Bodytube("body", 1, 1)
+        tube.tags.append("plain")
+        tube.add_class_tag("OpenRocket", "a")
+        tube.add_class_tag("Other", "b")
+        tube.add_class_tag("OpenRocket", "c")
+        self.assertEqual(tube.tags, [
+            "plain",
+            {'class': "OpenRocket", 'tags': ["a", "c"]},
+            {'class': "Other", 'tags': ["b"]},
+        ])
+
+        # replacing the tags starts over
+        tube.tags = [{'class': "Other", 'tags': []}]
+        tube.add_class_tag("Other", "d")
+        self.assertEqual(tube.tags, [{'class': "Other", 'tags': ["d"]}])
+
+        # editing the tags list directly
+        del tube.tags[:]
+        tube.add_class_tag("Other", "e")
+        self.assertEqual(tube.tags, [{'class': "Other", 'tags': ["e"]}])
+        tube.tags[0] = {'class': "Other", 'tags': ["f"]}
+        tube.add_class_tag("Other", "g")
+        self.assertEqual(tube.tags, [{'class': "Other", 'tags': ["f", "g"]}])
+        tube.tags.insert(0, "plain")
+        tube.add_class_tag("Other", "h")
+        self.assertEqual(tube.tags, ["plain", {'class': "Other", 'tags': ["f", "g", "h"]}])
+        tube.tags.pop()
+        tube.add_class_tag("Other", "i")
+        self.assertEqual(tube.tags, ["plain", {'class': "Other", 'tags': ["i"]}])
+
     def test_no_color(self):
         tube = document.Bodytube("body", 24.1, 1)
 
@@ -133,6 +257,28 @@ class TestOpenrocketdoc(unittest.TestCase):
         engine.length = 25.4
         self.assertEqual(engine.length, 25.4)
 
+    def test_engine_tanks(self):
+        engine = document.Engine("test")
+        engine.tanks.append({'mass': 1.5, 'length': 0.4, 'diameter': 0.1})
+        self.assertAlmostEqual(engine.length, 0.4)
+        self.assertAlmostEqual(engine.diameter, 0.1)
+        self.assertAlmostEqual(engine.m_init, 1.5)
+
+        engine.tanks.append({'mass': 2.0, 'length': 0.6, 'diameter': 0.2})
+        self.assertAlmostEqual(engine.length, 1.0)
+        self.assertAlmostEqual(engine.diameter, 0.2)
+        self.assertAlmostEqual(engine.m_init, 3.5)
+
+        # edit a tank in place
+        engine.tanks[0]['mass'] = 5
+        self.assertAlmostEqual(engine.m_init, 7.0)
+        engine.m_prop = 7.0
+        self.assertAlmostEqual(engine.m_frac, 50.0)
+
+        engine.tanks = []
+        self.assertEqual(engine.length, 0)
+        self.assertEqual(engine.diameter, 0)
+
     def test_engine_t_burn(self):
         engine = document.Engine("test Name")
         engine.t_burn = 123.456
@@ -143,6 +289,17 @@ class TestOpenrocketdoc(unittest.TestCase):
         engine.Isp = 123
         self.assertAlmostEqual(engine.V_e, 1206.21795)
 
+    def test_engine_ve_updates(self):
+        engine = document.Engine("test Name")
+        engine.Isp = 123
+        self.assertAlmostEqual(engine.V_e, 1206.21795)
+
+        # derived numbers follow their inputs
+        engine.Isp = 200
+        self.assertAlmostEqual(engine.V_e, 1961.33)
+        engine.V_e = 980.665
+        self.assertAlmostEqual(engine.Isp, 100)
+
     def test_engine_simple_0(self):
         engine = document.Engine("test Name")
 
@@ -175,6 +332,38 @@ class TestOpenrocketdoc(unittest.TestCase):
         self.assertAlmostEqual(engine.thrust_peak, 4567)
         self.assertAlmostEqual(engine.V_e, 1206.21795)
 
+    def test_engine_constrained(self):
+        engine = document.Engine("test Name")
+        self.assertFalse(engine.constrained)
+
+        engine.thrust_avg = 4567
+        self.assertFalse(engine.constrained)
+        engine.t_burn = 89
+        self.assertTrue(engine.constrained)
+
+        engine.I_total = 0
+        self.assertFalse(engine.constrained)
+
+        engine = document.Engine("test Name")
+        engine.Isp = 123
+        self.assertFalse(engine.constrained)
+        engine.m_prop = 1.0
+        self.assertTrue(engine.constrained)
+
+        engine = document.Engine("test Name")
+        engine.thrustcurve = [{'t': 0, 'thrust': 0}, {'t': 1, 'thrust': 0}]
+        self.assertFalse(engine.constrained)
+
+    def test_engine_m_frac(self):
+        engine = document.Engine("test Name")
+        engine.m_prop = 1.0
+        engine.tanks.append({'mass': 3.0, 'length': 1, 'diameter': 0.1})
+        self.assertAlmostEqual(engine.m_frac, 25)
+
+        # set directly
+        engine.m_frac = 30
+        self.assertAlmostEqual(engine.m_frac, 30)
+
     def test_engine_name(self):
         engine = document.Engine("test Name")
         self.assertEqual(engine.name, "test Name")
@@ -317,6 +506,128 @@ class TestOpenrocketdoc(unittest.TestCase):
 
         self.assertAlmostEqual(engine.I_total, 500)
 
+    def test_engine_thrustcurve_updates(self):
+        engine = document.Engine("test Name")
+        engine.thrustcurve.append({'t': 0, 'thrust': 500})
+        engine.thrustcurve.append({'t': 1, 'thrust': 500})
+        self.assertAlmostEqual(engine.I_total, 500)
+        self.assertAlmostEqual(engine.t_burn, 1)
+
+        # adding to the curve is seen by the cached numbers
+        engine.thrustcurve.append({'t': 2, 'thrust': 1000})
+        self.assertAlmostEqual(engine.I_total, 1250)
+        self.assertAlmostEqual(engine.thrust_peak, 1000)
+        self.assertAlmostEqual(engine.t_burn, 2)
+
+    def test_engine_thrust(self):
+        engine = document.Engine("test Name")
+        engine.thrust_avg = 300
+        self.assertAlmostEqual(engine.thrust(0.5), 300)
+
+        engine.thrustcurve = [{'t': 0, 'thrust': 0}, {'t': 0.5, 'thrust': 1000}, {'t': 2, 'thrust': 400}]
+        self.assertAlmostEqual(engine.thrust(0), 0)
+        self.assertAlmostEqual(engine.thrust(0.25), 500)
+        self.assertAlmostEqual(engine.thrust(0.5), 1000)
+        self.assertAlmostEqual(engine.thrust(1.25), 700)
+        self.assertAlmostEqual(engine.thrust(2), 400)
+
+        # before and after the burn
+        self.assertEqual(engine.thrust(-1), 0)
+        self.assertEqual(engine.thrust(2.1), 0)
+
+    def test_thrustcurve_columns(self):
+        curve = document.Thrustcurve([{'t': 0, 'thrust': 10}])
+        curve.add_point(0.5, 20, mass=0.1)
+        curve.append({'t': 1, 'thrust': 0})
+
+        self.assertEqual(len(curve), 3)
+        self.assertEqual(list(curve.t), [0, 0.5, 1])
+        self.assertEqual(list(curve.thrust), [10, 20, 0])
+        self.assertEqual(list(curve.extra['mass']), [0, 0.1, 0])
+        self.assertEqual(curve[1], {'t': 0.5, 'thrust': 20, 'mass': 0.1})
+        self.assertEqual(curve[1:], [{'t': 0.5, 'thrust': 20, 'mass': 0.1}, {'t': 1, 'thrust': 0, 'mass': 0}])
+        self.assertEqual(type(curve[1:]), list)
+
+        curve.set_curve([0, 2], [5, 0], mass=[1, 0.5])
+        self.assertEqual(len(curve), 2)
+        self.assertEqual(curve[1], {'t': 2, 'thrust': 0, 'mass': 0.5})
+
+        engine = document.Engine("test Name")
+        engine.thrustcurve = [{'t': 0, 'thrust': 500}, {'t': 1, 'thrust': 500}]
+        self.assertEqual(type(engine.thrustcurve), document.Thrustcurve)
+        self.assertAlmostEqual(engine.I_total, 500)
+
+    def test_thrustcurve_edits(self):
+        engine = document.Engine("test Name")
+        engine.thrustcurve = [{'t': 0, 'thrust': 100}, {'t': 1, 'thrust': 100}]
+        self.assertAlmostEqual(engine.I_total, 100)
+
+        # samples are plain dict copies, assign them back to change the curve
+        point = engine.thrustcurve[1]
+        self.assertEqual(type(point), dict)
+        point['thrust'] = 300
+        self.assertEqual(engine.thrustcurve[1]['thrust'], 100)
+        engine.thrustcurve[1] = point
+        self.assertEqual(engine.thrustcurve[1]['thrust'], 300)
+        self.assertAlmostEqual(engine.I_total, 200)
+        self.assertAlmostEqual(engine.thrust_peak, 300)
+        engine.thrustcurve[-1] = {'t': 1, 'thrust': 50, 'mass': 1}
+        self.assertEqual(engine.thrustcurve[0], {'t': 0, 'thrust': 100, 'mass': 0})
+        self.assertEqual(engine.thrustcurve[1], {'t': 1, 'thrust': 50, 'mass': 1})
+        with self.assertRaises(IndexError):
+            engine.thrustcurve[2] = {'t': 2, 'thrust': 0}
+        with self.assertRaises(KeyError):
+            engine.thrustcurve[0] = {'thrust': 0}
+        self.assertEqual(len(engine.thrustcurve), 2)
+        engine.thrustcurve = [{'t': 0, 'thrust': 50}, {'t': 1, 'thrust': 50}]
+        self.assertAlmostEqual(engine.I_total, 50)
+
+        # list style edits
+        engine.thrustcurve[1] = {'t': 2, 'thrust': 50}
+        self.assertAlmostEqual(engine.t_burn, 2)
+        engine.thrustcurve.extend([{'t': 3, 'thrust': 0}])
+        self.assertEqual(len(engine.thrustcurve), 3)
+        self.assertAlmostEqual(engine.t_burn, 3)
+        del engine.thrustcurve[-1]
+        self.assertAlmostEqual(engine.t_burn, 2)
+        engine.thrustcurve[:] = [{'t': 0, 'thrust': 10}, {'t': 4, 'thrust': 10}]
+        self.assertAlmostEqual(engine.I_total, 40)
+        self.assertEqual(engine.thrustcurve, [{'t': 0, 'thrust': 10}, {'t': 4, 'thrust': 10}])
+        self.assertNotEqual(engine.thrustcurve, [{'t': 0, 'thrust': 10}])
+
+        # the rest of the list API
+        curve = engine.thrustcurve
+        curve.insert(1, {'t': 2, 'thrust': 20})
+        self.assertEqual([p['t'] for p in curve], [0, 2, 4])
+        self.assertEqual(curve.index({'t': 2, 'thrust': 20}), 1)
+        self.assertEqual(curve.count({'t': 0, 'thrust': 10}), 1)
+        self.assertIn({'t': 2, 'thrust': 20}, curve)
+        self.assertEqual(curve.pop(1), {'t': 2, 'thrust': 20})
+        self.assertAlmostEqual(engine.I_total, 40)
+        engine.thrustcurve += [{'t': 5, 'thrust': 0}]
+        self.assertIs(engine.thrustcurve, curve)
+        self.assertAlmostEqual(engine.t_burn, 5)
+        curve.remove({'t': 5, 'thrust': 0})
+        self.assertAlmostEqual(engine.t_burn, 4)
+        curve.reverse()
+        self.assertEqual([p['t'] for p in curve], [4, 0])
+        curve.sort()
+        self.assertEqual([p['t'] for p in curve], [0, 4])
+        curve.sort(key=lambda p: -p['t'])
+        self.assertEqual([p['t'] for p in curve], [4, 0])
+        curve.sort()
+
+        # the columns are copies, writing to them can't change the curve
+        engine.thrustcurve.thrust[1] = 300
+        self.assertEqual(engine.thrustcurve[1]['thrust'], 10)
+        self.assertAlmostEqual(engine.I_total, 40)
+        with self.assertRaises(AttributeError):
+            engine.thrustcurve.thrust = [0, 0]
+
+        curve.clear()
+        self.assertEqual(len(curve), 0)
+        self.assertEqual(engine.I_total, 0)
+
     def test_engine_avgthrust(self):
         engine = document.Engine("test Name")
 
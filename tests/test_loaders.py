@@ -9,7 +9,15 @@ Tests for `loaders` module.
 """
 
 from __future__ import print_function
+import os
+import shutil
+import tempfile
 import unittest
+try:
+    from pathlib import Path
+except ImportError:
+    # Python 2
+    Path = None
 from openrocketdoc import document
 from openrocketdoc import loaders
 # from openrocketdoc import writers
@@ -124,6 +132,45 @@ class TestLoaders(unittest.TestCase):
         self.assertAlmostEqual(eng.m_frac, 48.39, places=2)
         self.assertEqual(len(eng.thrustcurve), 27)
 
+    def test_read_RaspEng_str(self):
+        with open('tests/data/motor_f10.eng') as fh:
+            eng_str = fh.read()
+
+        # file contents, and a file handle, load the same as a filename
+        eng = loaders.RaspEngine().load(eng_str)
+        self.assertEqual(eng.name, "F10")
+        self.assertEqual(len(eng.thrustcurve), 27)
+
+        with open('tests/data/motor_f10.eng') as fh:
+            eng = loaders.RaspEngine().load(fh)
+        self.assertEqual(eng.name, "F10")
+        self.assertEqual(len(eng.thrustcurve), 27)
+
+    @unittest.skipIf(Path is None, "no pathlib")
+    def test_read_RaspEng_path(self):
+        eng = loaders.RaspEngine().load(Path('tests/data/motor_f10.eng'))
+        self.assertEqual(eng.name, "F10")
+        self.assertEqual(len(eng.thrustcurve), 27)
+
+    def test_read_RaspEng_long_filename(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            # a path longer than 255 characters is still a filename
+            longdir = os.path.join(tmpdir, *(['d' * 60] * 5))
+            os.makedirs(longdir)
+            filename = os.path.join(longdir, 'motor_f10.eng')
+            shutil.copy('tests/data/motor_f10.eng', filename)
+            self.assertGreater(len(filename), 255)
+
+            eng = loaders.RaspEngine().load(filename)
+            self.assertEqual(eng.name, "F10")
+            self.assertEqual(len(eng.thrustcurve), 27)
+
+            eng = loaders.RaspEngine().load(filename.encode())
+            self.assertEqual(eng.name, "F10")
+        finally:
+            shutil.rmtree(tmpdir)
+
     def tearDown(self):
         pass
 